@@ -2,8 +2,42 @@ from typing import Optional, List, Tuple, Dict
 from word_graph import WordGraph
 from search import SearchAlgorithms
 import random
+import sys
+
+# letters challenge mode can block
+_ALPHABET = tuple('abcdefghijklmnopqrstuvwxyz')
+
+# tried and tested word pairs, used when random pair search fails
+RELIABLE_PAIRS = (
+    ("cat", "dog"),
+    ("cold", "warm"),
+    ("dark", "light"),
+    ("head", "tail"),
+    ("good", "evil"),
+    ("love", "hate"),
+    ("life", "dead"),
+    ("soft", "hard"),
+    ("fast", "slow"),
+    ("poor", "rich")
+)
+
+def _normalize_word(word: str) -> str:
+    # lowercase once at the edge, interned like dictionary words so set lookups are quick
+    return sys.intern(word.lower())
 
 class WordLadderGame:
+    # fixed set of attributes, no per-game __dict__ (add new ones here too)
+    __slots__ = (
+        'word_graph', 'search',
+        'current_word', 'target_word', 'moves', 'best_path',
+        '_best_path_index', '_dist_to_target', '_current_path_index', '_current_neighbors',
+        'difficulty', 'score', '_score_multiplier', '_optimal_moves', 'banned_words',
+        'move_limit', '_playable', '_playable_words',
+        '_algorithm_stats_cache', 'selected_algorithm', '_comparison_cache', '_hint_cache',
+        '_path_cache', 'max_attempts', 'restricted_letters', 'min_word_length',
+        'max_word_length', '_connected_pairs', '_fallback_pairs', '_words_by_length'
+    )
+    
     def __init__(self):
         # main game things we need
         self.word_graph = WordGraph()
@@ -13,26 +47,54 @@ class WordLadderGame:
         self.current_word = None
         self.target_word = None
         self.moves = []
-        self.best_path = None
+        self.best_path: Optional[Tuple[str, ...]] = None
+        # word -> position on best path, for quick lookups
+        self._best_path_index: Dict[str, int] = {}
+        # steps from every reachable word to target, filled once per game
+        self._dist_to_target: Dict[str, int] = {}
+        # where current word sits on best path, -1 means player went off it
+        self._current_path_index = 0
+        # words reachable from current word, refreshed whenever it changes
+        self._current_neighbors = frozenset()
         
         # game settings
         self.difficulty = "beginner"
         self.score = 0
-        self.banned_words = set()
+        self._score_multiplier = 1.0  # set once per difficulty
+        self._optimal_moves = 0  # set once per game
+        self.banned_words = frozenset()
         self.move_limit = 10
+        # every word allowed under current rules, rebuilt when rules change (None = not built yet)
+        self._playable: Optional[frozenset] = None
+        # same words as a tuple so fallback can pick randomly without building a list
+        self._playable_words: Tuple[str, ...] = ()
         
         # keeping track of which search method working best
-        self.algorithm_stats = {}
+        self._algorithm_stats_cache = None  # filled only when someone asks for stats
         self.selected_algorithm = 'A*'
+        # remembering comparison results so we don't search again for same words
+        self._comparison_cache: Dict[Tuple[str, str], Dict] = {}
+        # hints already given this game, keyed by (current word, target)
+        self._hint_cache: Dict[Tuple[str, str], Tuple[Optional[str], str]] = {}
+        # paths each method already found, keyed by (method, start, target)
+        self._path_cache: Dict[Tuple[str, str, str], Tuple[Optional[List[str]], Dict[str, int]]] = {}
         
         # how much we try to find good word pairs
         self.max_attempts = 100  # Increased from 50 to 100
         
         # setting for different modes
-        self.restricted_letters = set()  # for challenge mode
+        self.restricted_letters = frozenset()  # for challenge mode
         self.min_word_length = 3  
         self.max_word_length = 7 
         
+        # reliable pairs that exist in dictionary and are connected (checked once at setup),
+        # and the ones still allowed under current rules (None = not filtered yet)
+        self._connected_pairs: Tuple[Tuple[str, str], ...] = ()
+        self._fallback_pairs: Optional[Tuple[Tuple[str, str], ...]] = None
+        
+        # dictionary words grouped by length, filled once in initialize_game
+        self._words_by_length: Dict[int, Tuple[str, ...]] = {}
+        
     def initialize_game(self, dictionary_path: str):
         try:
             # loading our dictionary
@@ -41,9 +103,24 @@ class WordLadderGame:
                 print("error: Dictionary is Empty!")
                 return False
                 
+            # grouping words by length so picking pairs doesn't scan whole dictionary,
+            # kept as tuples so we can pick by index without copying
+            length_groups: Dict[int, List[str]] = {}
+            for word in self.word_graph.word_list:
+                length_groups.setdefault(len(word), []).append(word)
+            self._words_by_length = {length: tuple(words) for length, words in length_groups.items()}
+                
             # making word connections
             self.word_graph.build_word_network()
             self.search = SearchAlgorithms(self.word_graph)
+            
+            # paths don't depend on difficulty rules, so checking trusted pairs only once
+            self._connected_pairs = tuple(
+                (start, target) for start, target in RELIABLE_PAIRS
+                if self.word_graph.is_valid_word(start) and self.word_graph.is_valid_word(target)
+                and self.search.bidir_bfs(start, target) is not None
+            )
+            self._fallback_pairs = None
             return True
         except Exception as e:
             print(f"Game Setup Failed: {str(e)}")
@@ -53,137 +130,143 @@ class WordLadderGame:
         # changing search method
         if algorithm in ['BFS', 'UCS', 'A*']:
             self.selected_algorithm = algorithm
-            # need to find path again with new method
-            if self.current_word and self.target_word:
-                self.best_path = self.calculate_best_path()
+            # best path comes from bfs, so nothing to search again here
     
     def set_difficulty(self, difficulty: str):
-        try:
-            self.difficulty = difficulty.lower()
+        if not isinstance(difficulty, str):
+            return False
+        self.difficulty = difficulty.lower()
+        
+        # different modes get different score multipliers, fixing it here once
+        multipliers = {
+            "beginner": 1.0,
+            "advanced": 1.5,
+            "challenge": 2.0
+        }
+        self._score_multiplier = multipliers.get(self.difficulty, 1.0)
+        
+        # different settings for different levels
+        if self.difficulty == "beginner":
+            # easy mode for new players
+            self.move_limit = 10
+            self.min_word_length = 3
+            self.max_word_length = 4
+            self.banned_words = frozenset()
+            self.restricted_letters = frozenset()
             
-            # different settings for different levels
-            if self.difficulty == "beginner":
-                # easy mode for new players
-                self.move_limit = 10
-                self.min_word_length = 3
-                self.max_word_length = 4
-                self.banned_words.clear()
-                self.restricted_letters.clear()
-                
-            elif self.difficulty == "advanced":
-                # thora mushkil mode
-                self.move_limit = 15
-                self.min_word_length = 4
-                self.max_word_length = 6
-                self.banned_words.clear()
-                self.restricted_letters.clear()
-                
-            elif self.difficulty == "challenge":
-                # hardcore mode
-                self.move_limit = 12
-                self.min_word_length = 4  # Reduced from 5 to 4
-                self.max_word_length = 6  # Reduced from 7 to 6
-                self.banned_words.clear()
-                
-                # finding good word pair first
-                word_pair = self.find_valid_word_pair(4, 6, 5, 8)  # Adjusted parameters
-                if word_pair:
-                    start_word, target_word = word_pair
-                    # getting all possible words in between
-                    possible_words = self.word_graph.find_possible_words(start_word, target_word)
-                    # picking some words to ban
-                    ban_candidates = [w for w in possible_words 
-                                   if w != start_word and w != target_word]
-                    if ban_candidates:
-                        self.banned_words = set(random.sample(ban_candidates, 
-                                                            min(3, len(ban_candidates))))  # Reduced from 5 to 3
-                    
-                # blocking some letters
-                self.restricted_letters = set(random.sample('abcdefghijklmnopqrstuvwxyz', 2))  # Reduced from 3 to 2
+        elif self.difficulty == "advanced":
+            # thora mushkil mode
+            self.move_limit = 15
+            self.min_word_length = 4
+            self.max_word_length = 6
+            self.banned_words = frozenset()
+            self.restricted_letters = frozenset()
             
-            # trying to start game with new settings
-            if not self.start_new_game_for_difficulty():
-                print("new settings se game start nahi hua")
-                return False
-            return True
+        elif self.difficulty == "challenge":
+            # hardcore mode
+            self.move_limit = 12
+            self.min_word_length = 4  # Reduced from 5 to 4
+            self.max_word_length = 6  # Reduced from 7 to 6
+            self.banned_words = frozenset()
             
-        except Exception as e:
-            print(f"difficulty change nahi hui: {str(e)}")
+            # finding good word pair first
+            pair_search = self._find_pair_with_distances(4, 6, 5, 8)  # Adjusted parameters
+            if pair_search:
+                start_word, target_word, possible_words = pair_search
+                # bfs from start already reached all possible words, so no second walk needed
+                # picking some words to ban
+                ban_candidates = [w for w in possible_words 
+                               if w != start_word and w != target_word]
+                if ban_candidates:
+                    self.banned_words = frozenset(random.sample(ban_candidates, 
+                                                              min(3, len(ban_candidates))))  # Reduced from 5 to 3
+                
+            # blocking some letters
+            self.restricted_letters = frozenset(random.sample(_ALPHABET, 2))  # Reduced from 3 to 2
+        
+        # rules changed so rebuilding allowed words, old paths are useless now too
+        self._rebuild_playable()
+        self._filter_fallback_pairs()
+        self._path_cache.clear()
+        
+        # trying to start game with new settings
+        if not self.start_new_game_for_difficulty():
+            print("new settings se game start nahi hua")
             return False
+        return True
         
     def find_valid_word_pair(self, min_len: int, max_len: int, min_path: int, max_path: int) -> Optional[Tuple[str, str]]:
-        try:
-            # getting words that fit our rules
-            word_list = [w for w in self.word_graph.word_list 
-                        if min_len <= len(w) <= max_len 
-                        and w not in self.banned_words
-                        and not any(letter in self.restricted_letters for letter in w)]
-            
-            if not word_list:
-                return None
-            
-            # trying different starting words
-            for _ in range(self.max_attempts):
-                start_word = random.choice(word_list)
-                potential_targets = []
-                
-                # looking for good target words
-                for target in random.sample(word_list, min(100, len(word_list))):  # Increased from 50 to 100
-                    if target != start_word:
-                        path, _ = self.search.astar(start_word, target)
-                        if path and min_path <= len(path) <= max_path:
-                            potential_targets.append(target)
-                            # bas itne kaafi hain
-                            if len(potential_targets) >= 5:
-                                break
-                
-                if potential_targets:
-                    return start_word, random.choice(potential_targets)
-            
+        pair_search = self._find_pair_with_distances(min_len, max_len, min_path, max_path)
+        if pair_search is None:
             return None
-        except Exception as e:
-            print(f"word pair dhundne mein masla hogaya: {str(e)}")
+        start_word, target_word, _ = pair_search
+        return start_word, target_word
+        
+    def _find_pair_with_distances(self, min_len: int, max_len: int, min_path: int,
+                                  max_path: int) -> Optional[Tuple[str, str, Dict[str, int]]]:
+        # same as find_valid_word_pair but also giving back bfs distances from start word
+        # words of right length straight from length groups, rules checked only on picked words
+        length_groups = [self._words_by_length.get(length, ()) for length in range(min_len, max_len + 1)]
+        total_words = sum(len(words) for words in length_groups)
+        
+        if not total_words:
             return None
         
-    def get_fallback_word_pair(self) -> Tuple[str, str]:
-        # tried and tested word pairs
-        reliable_pairs = [
-            ("cat", "dog"),   
-            ("cold", "warm"),
-            ("dark", "light"), 
-            ("head", "tail"),
-            ("good", "evil"), 
-            ("love", "hate"), 
-            ("life", "dead"), 
-            ("soft", "hard"), 
-            ("fast", "slow"), 
-            ("poor", "rich") 
-        ]
-        
-        # trying our trusted pairs first
-        for start, target in reliable_pairs:
-            if (self.word_graph.is_valid_word(start) and 
-                self.word_graph.is_valid_word(target) and
-                start not in self.banned_words and 
-                target not in self.banned_words and
-                not any(letter in self.restricted_letters for letter in start) and
-                not any(letter in self.restricted_letters for letter in target)):
-                path, _ = self.search.astar(start, target)
-                if path:
-                    return start, target
-        
-        # last option: koi bhi do words
-        valid_words = [w for w in self.word_graph.word_list 
-                      if w not in self.banned_words 
-                      and len(w) >= self.min_word_length
-                      and len(w) <= self.max_word_length
-                      and not any(letter in self.restricted_letters for letter in w)]
+        # trying different starting words, sampling indexes so no start is tried twice
+        for index in random.sample(range(total_words), min(self.max_attempts, total_words)):
+            start_word = self._pick_word(length_groups, index)
+            if not self._fits_pair_rules(start_word):
+                continue
+            
+            # one bfs gives path length to every target, no need for astar per target
+            distances = self.search.bfs_all_distances(start_word)
+            potential_targets = [target for target, distance in distances.items()
+                                 if min_path <= distance + 1 <= max_path
+                                 and min_len <= len(target) <= max_len
+                                 and self._fits_pair_rules(target)]
+            
+            if potential_targets:
+                return start_word, random.choice(potential_targets), distances
+        
+        return None
+        
+    def _pick_word(self, length_groups: List[Tuple[str, ...]], index: int) -> str:
+        # finding which length group the index falls in, no need to join groups into one list
+        for words in length_groups:
+            if index < len(words):
+                return words[index]
+            index -= len(words)
+        raise IndexError("word index out of range")
+        
+    def _fits_pair_rules(self, word: str) -> bool:
+        # word not banned and has no blocked letters (isdisjoint checks all letters in one go)
+        return word not in self.banned_words and self.restricted_letters.isdisjoint(word)
+        
+    def get_fallback_word_pair(self) -> Optional[Tuple[str, str]]:
+        # trusted pairs were checked once at setup and filtered when rules changed
+        if self._fallback_pairs is None:
+            self._filter_fallback_pairs()
+        if self._fallback_pairs:
+            return self._fallback_pairs[0]
+        
+        # last option: koi bhi do words (already filtered when rules were set)
+        if self._playable is None:
+            self._rebuild_playable()
+        valid_words = self._playable_words
         if len(valid_words) >= 2:
             return random.choice(valid_words), random.choice(valid_words)
         
-        raise ValueError("koi bhi working word pair nahi mila!")
+        # koi bhi working word pair nahi mila
+        return None
         
-    def get_word_pair_for_difficulty(self) -> Tuple[str, str]:
+    def _filter_fallback_pairs(self):
+        # keeping trusted pairs with no banned words or blocked letters
+        self._fallback_pairs = tuple(
+            (start, target) for start, target in self._connected_pairs
+            if self._fits_pair_rules(start) and self._fits_pair_rules(target)
+        )
+        
+    def get_word_pair_for_difficulty(self) -> Optional[Tuple[str, str]]:
         word_pair = None
         
         # different difficulties need different types of words
@@ -200,41 +283,55 @@ class WordLadderGame:
         return word_pair
         
     def start_new_game_for_difficulty(self) -> bool:
-        try:
-            # giving it a few tries to find good words
-            for attempt in range(3):
-                try:
-                    start_word, target_word = self.get_word_pair_for_difficulty()
-                    if self.start_new_game(start_word, target_word):
-                        return True
-                except Exception as e:
-                    print(f"try {attempt + 1} fail hogaya: {str(e)}")
-                    continue
-            return False
-        except Exception as e:
-            print(f"new game start nahi hua: {str(e)}")
-            return False
+        # giving it a few tries to find good words
+        for attempt in range(3):
+            word_pair = self.get_word_pair_for_difficulty()
+            if word_pair is None:
+                print(f"try {attempt + 1} fail hogaya: koi word pair nahi mila")
+                continue
+            if self.start_new_game(*word_pair):
+                return True
+        return False
         
     def is_word_valid(self, word: str) -> bool:
         if not word:
             return False
-            
-        word = word.lower()
-        
-        # checking all the rules
-        if not self.word_graph.is_valid_word(word):
+        return self._is_word_valid_lower(_normalize_word(word))
+        
+    def _is_word_valid_lower(self, word: str) -> bool:
+        # same as is_word_valid but word is already lowercase (internal callers)
+        # all rules already applied when building playable words, just one lookup
+        if self._playable is not None:
+            return word in self._playable
+        return self._check_word_rules(word)
+        
+    def _rebuild_playable(self):
+        # applying all word rules once to whole dictionary (using length groups)
+        # letters only matter in challenge mode, and only if some are blocked
+        check_letters = self.difficulty == "challenge" and bool(self.restricted_letters)
+        self._playable_words = tuple(
+            w for length in range(self.min_word_length, self.max_word_length + 1)
+            for w in self._words_by_length.get(length, ())
+            if w not in self.banned_words
+            and not (check_letters and not self.restricted_letters.isdisjoint(w))
+        )
+        self._playable = frozenset(self._playable_words)
+        
+    def _check_word_rules(self, word: str) -> bool:
+        # checking all the rules, word is lowercase already
+        if word not in self.word_graph.word_list:
             return False
             
         if word in self.banned_words:
             return False
             
-        # length check karo
-        if len(word) < self.min_word_length or len(word) > self.max_word_length:
+        # length check karo, both bounds in one go
+        if not self.min_word_length <= len(word) <= self.max_word_length:
             return False
             
-        # challenge mode mein extra checks
-        if self.difficulty == "challenge":
-            if any(letter in self.restricted_letters for letter in word):
+        # challenge mode mein extra checks, nothing to check if no letters blocked
+        if self.difficulty == "challenge" and self.restricted_letters:
+            if not self.restricted_letters.isdisjoint(word):
                 return False
                 
         return True
@@ -243,34 +340,65 @@ class WordLadderGame:
         # checking if move is allowed
         if not word or not isinstance(word, str):
             return False
+        return self._is_valid_move_lower(_normalize_word(word))
+        
+    def _is_valid_move_lower(self, word: str) -> bool:
+        # move check for a word that is already lowercase
         if len(self.moves) >= self.move_limit:
             return False
-        word = word.lower()
-        if not self.is_word_valid(word):
-            return False
-        return word in self.word_graph.get_connected_words(self.current_word)
+        # neighbor check is cheaper so doing it before the dictionary rules
+        return word in self._current_neighbors and self._is_word_valid_lower(word)
+        
+    def _cached_search(self, algorithm: str, start_word: str, target_word: str) -> Tuple[Optional[List[str]], Dict[str, int]]:
+        # searching only if this method never found a path from here to target
+        cache_key = (algorithm, start_word, target_word)
+        if cache_key not in self._path_cache:
+            algorithms = {
+                'BFS': self.search.bfs,
+                'UCS': self.search.ucs,
+                'A*': self.search.astar
+            }
+            path, costs = algorithms[algorithm](start_word, target_word)
+            self._store_path(algorithm, start_word, target_word, path, costs)
+        return self._path_cache[cache_key]
+        
+    def _store_path(self, algorithm: str, start_word: str, target_word: str,
+                    path: Optional[List[str]], costs: Dict[str, int]):
+        self._path_cache[(algorithm, start_word, target_word)] = (path, costs)
+        
+        # rest of a bfs path is also shortest from each word on it, so saving those
+        # too for when player follows the path (other methods only keep what they searched)
+        if algorithm != 'BFS':
+            return
+        for index in range(1, len(path or [])):
+            suffix = path[index:]
+            suffix_key = (algorithm, suffix[0], target_word)
+            if suffix_key not in self._path_cache:
+                self._path_cache[suffix_key] = (suffix, self.search.get_path_stats(suffix, target_word))
         
     def get_algorithm_comparison(self) -> Dict:
         # comparing different search methods
         if not self.current_word or not self.target_word:
             return {}
             
+        # already compared these two words? just reuse it
+        cache_key = (self.current_word, self.target_word)
+        if cache_key in self._comparison_cache:
+            return self._comparison_cache[cache_key]
+            
         results = {}
-        algorithms = {
-            'BFS': self.search.bfs,   # simple search
-            'UCS': self.search.ucs,   # cost wala search
-            'A*': self.search.astar   # smart search
-        }
         
-        # trying each method
-        for name, algorithm in algorithms.items():
-            path, costs = algorithm(self.current_word, self.target_word)
+        # trying each method (bfs simple, ucs cost wala, a* smart), ones that already
+        # searched from here (like bfs for best path) come straight from path cache
+        for name in ('BFS', 'UCS', 'A*'):
+            path, costs = self._cached_search(name, self.current_word, self.target_word)
             if path is not None:
                 results[name] = {
                     'path': path,
                     'costs': costs
                 }
                 
+        self._comparison_cache[cache_key] = results
         return results
         
     def get_hint(self) -> Tuple[Optional[str], str]:
@@ -278,32 +406,38 @@ class WordLadderGame:
         if not self.best_path:
             return None, "No path found yet!"
             
-        try:
-            current_index = self.best_path.index(self.current_word)
-        except ValueError:
-            # we're lost, need new directions
-            algo_name = 'astar' if self.selected_algorithm == 'A*' else self.selected_algorithm.lower()
-            new_path, costs = getattr(self.search, algo_name)(
-                self.current_word, self.target_word
-            )
-            if not new_path:
-                return None, "No path found from current word!"
-            self.best_path = new_path
-            current_index = 0
-
-        if current_index >= len(self.best_path) - 1:
-            return None, "You're already at the end!"
+        # maybe player came back onto best path after a detour, fixing position
+        # here so it doesn't depend on whether hint was cached already
+        if self._current_path_index == -1:
+            self._current_path_index = self._best_path_index.get(self.current_word, -1)
             
-        next_word = self.best_path[current_index + 1]
+        # hint comes from best path and target distances, not from selected method,
+        # so same word and target always give same hint, building it only once
+        hint_key = (self.current_word, self.target_word)
+        if hint_key not in self._hint_cache:
+            self._hint_cache[hint_key] = self._build_hint()
+        return self._hint_cache[hint_key]
+        
+    def _build_hint(self) -> Tuple[Optional[str], str]:
+        current_index = self._current_path_index
+        if current_index != -1:
+            if current_index >= len(self.best_path) - 1:
+                return None, "You're already at the end!"
+            next_word = self.best_path[current_index + 1]
+            # calculating hint costs straight from best path, no need to search again
+            g_cost = len(self.best_path) - 1 - current_index
+        else:
+            # we're lost, distances to target tell which neighbor gets us closer
+            g_cost = self._dist_to_target.get(self.current_word)
+            if g_cost is None:
+                return None, "No path found from current word!"
+            next_word = min(self._current_neighbors,
+                            key=lambda word: self._dist_to_target.get(word, float('inf')))
         
-        # calculating hint costs
-        current_path = self.best_path[current_index:]
-        g_cost = len(current_path) - 1
         h_cost = self.search.estimate_remaining_steps(self.current_word, self.target_word)
         f_cost = g_cost + h_cost
         
         hint_message = (
-        f"Using {self.selected_algorithm}\n"
         f"So far {g_cost} steps\n"
         f"Estimated {h_cost} steps remaining\n"
         f"Total estimate {f_cost} steps\n"
@@ -313,37 +447,36 @@ class WordLadderGame:
             
         return next_word, hint_message
         
-    def calculate_best_path(self) -> Optional[List[str]]:
-        # finding best solution
-        if not self.current_word or not self.target_word:
-            return None
-            
-        algorithm_paths = self.get_algorithm_comparison()
-        
-        # saving stats for each method
-        self.algorithm_stats = {
-            name: {
-                'path': info['path'],
-                'length': len(info['path']),
-                'costs': info['costs']
+    @property
+    def algorithm_stats(self) -> Dict:
+        # stats for each method, only running the comparison when stats are actually read
+        if self._algorithm_stats_cache is None:
+            self._algorithm_stats_cache = {
+                name: {
+                    'path': info['path'],
+                    'length': len(info['path']),
+                    'costs': info['costs']
+                }
+                for name, info in self.get_algorithm_comparison().items()
             }
-            for name, info in algorithm_paths.items()
-        }
-        
-        # using selected method's path if available
-        if self.selected_algorithm in algorithm_paths:
-            return algorithm_paths[self.selected_algorithm]['path']
-        
-        # otherwise use shortest path we found
-        valid_paths = [info['path'] for info in algorithm_paths.values()]
-        return min(valid_paths, key=len) if valid_paths else None
+        return self._algorithm_stats_cache
+        
+    def _set_best_path(self, path: Optional[List[str]]):
+        # storing path as tuple with word positions, path always starts at current word
+        if not path:
+            self.best_path = None
+            self._best_path_index = {}
+            self._current_path_index = -1
+            return
+        self.best_path = tuple(path)
+        self._best_path_index = {word: index for index, word in enumerate(self.best_path)}
+        self._current_path_index = 0
         
     def calculate_score(self) -> int:
         # calculating score
         if not self.best_path:
             return 0
             
-        optimal_moves = len(self.best_path) - 1
         actual_moves = len(self.moves) - 1
         
         if actual_moves == 0:
@@ -352,57 +485,69 @@ class WordLadderGame:
         remaining_moves = self.move_limit - actual_moves
         
         # base score depends on efficiency
-        base_score = min(1000 * (optimal_moves / actual_moves), 1000)
+        base_score = min(1000 * (self._optimal_moves / actual_moves), 1000)
         # bonus for saving moves
         move_bonus = remaining_moves * 100
         
-        # different modes get different multipliers
-        multipliers = {
-            "beginner": 1.0,
-            "advanced": 1.5,
-            "challenge": 2.0
-        }
-        
-        return int((base_score + move_bonus) * multipliers.get(self.difficulty, 1.0))
+        return int((base_score + move_bonus) * self._score_multiplier)
         
     def start_new_game(self, start_word: str, target_word: str) -> bool:
-        try:
-            start_word = start_word.lower()
-            target_word = target_word.lower()
+        if not (isinstance(start_word, str) and isinstance(target_word, str)):
+            return False
+        start_word = _normalize_word(start_word)
+        target_word = _normalize_word(target_word)
+        
+        # checking if words are valid
+        if not (self._is_word_valid_lower(start_word) and self._is_word_valid_lower(target_word)):
+            return False
+        
+        # old paths belong to old game
+        self._path_cache.clear()
             
-            # checking if words are valid
-            if not (self.is_word_valid(start_word) and self.is_word_valid(target_word)):
-                return False
-                
-            # making sure there's a path between words
-            path, _ = self.search.astar(start_word, target_word)
-            if not path:
-                return False
-                
-            # setting up new game
-            self.current_word = start_word
-            self.target_word = target_word
-            self.moves = [start_word]
-            self.best_path = path
-            self.score = 0
-            self.algorithm_stats = {}
-            return True
-        except Exception as e:
-            print(f"Issue in starting a new game: {str(e)}")
+        # one bfs from target gives hint distances and also the best path,
+        # so no separate search just to check words are connected
+        dist_to_target = self.search.bfs_all_distances(target_word)
+        path = self.search.path_from_distances(start_word, dist_to_target)
+        if not path:
             return False
+        self._store_path('BFS', start_word, target_word, path,
+                         self.search.get_path_stats(path, target_word))
+            
+        # setting up new game
+        self.current_word = start_word
+        self.target_word = target_word
+        self._current_neighbors = self.word_graph.get_neighbors(start_word)
+        self.moves = [start_word]
+        self._set_best_path(path)
+        self._dist_to_target = dist_to_target
+        self._optimal_moves = len(path) - 1
+        self.score = 0
+        self._algorithm_stats_cache = None
+        self._comparison_cache.clear()
+        self._hint_cache.clear()
+        return True
         
     def make_move(self, new_word: str) -> bool:
-        try:
-            new_word = new_word.lower()
-            if not self.is_valid_move(new_word):
-                return False
-                
-            self.current_word = new_word
-            self.moves.append(new_word)
-            return True
-        except Exception as e:
-            print(f"Move Failed: {str(e)}")
+        # only thing that can go wrong here is getting something that isn't a word
+        if not isinstance(new_word, str):
+            return False
+        new_word = _normalize_word(new_word)
+        if not new_word or not self._is_valid_move_lower(new_word):
             return False
+            
+        self.current_word = new_word
+        self.moves.append(new_word)
+        self._current_neighbors = self.word_graph.get_neighbors(new_word)
+        self._algorithm_stats_cache = None
+        
+        # still following best path? then just move one step ahead
+        next_index = self._current_path_index + 1
+        if (self._current_path_index != -1 and next_index < len(self.best_path)
+                and self.best_path[next_index] == new_word):
+            self._current_path_index = next_index
+        else:
+            self._current_path_index = -1
+        return True
         
     def is_solved(self) -> bool:
         # checking if puzzle solved
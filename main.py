@@ -1,25 +1,23 @@
-import os
-import platform
-from rich.console import Console
+from typing import List, Dict
+from functools import lru_cache
+from rich.console import Console, Group
 from rich.panel import Panel
-from rich.layout import Layout
 from rich.table import Table
 from rich.text import Text
-from rich.prompt import Prompt
-from rich.style import Style
 from rich.align import Align
-from rich.box import DOUBLE, ROUNDED, HEAVY, ASCII_DOUBLE_HEAD
+from rich.box import ASCII_DOUBLE_HEAD
 from rich.columns import Columns
 from game import WordLadderGame
 
 console = Console()
 
 def clear_screen():
-    # clear screen ke liye
-    if platform.system().lower() == "windows":
-        os.system('cls')
-    else:
-        os.system('clear')
+    # clear screen ke liye, rich sends escape codes itself so no shell process every redraw
+    console.clear()
+
+def ask(prompt: str) -> str:
+    # styled prompt and plain input, no full Prompt object for every question
+    return console.input(prompt + ": ").strip().lower()
 
 def create_neon_text(text: str, color: str = "bright_yellow") -> str:
     # fancy text 
@@ -52,7 +50,147 @@ def create_separator() -> str:
     # line draw 
     return "\n[bright_yellow]" + "═" * console.width + "[/]\n"
 
-def display_game_state(game: WordLadderGame):
+def create_commands_panel() -> Panel:
+    # commands box, same every frame
+    commands_left = Table(show_header=False, box=None, padding=(0, 1))
+    commands_right = Table(show_header=False, box=None, padding=(0, 1))
+    
+    commands_left.add_row(create_retro_box(" WORD ", "black on green"), "[bright_white]Enter a word[/]")
+    commands_left.add_row(create_retro_box(" hint ", "black on yellow"), "[bright_white]Get AI hint[/]")
+    commands_left.add_row(create_retro_box(" algo ", "black on cyan"), "[bright_white]Change algorithm[/]")
+    commands_left.add_row(create_retro_box(" new ", "black on magenta"), "[bright_white]New game[/]")
+    
+    commands_right.add_row(create_retro_box(" compare ", "black on blue"), "[bright_white]Compare algorithms[/]")
+    commands_right.add_row(create_retro_box(" solution ", "black on green"), "[bright_white]See solution[/]")
+    commands_right.add_row(create_retro_box(" mode ", "black on yellow"), "[bright_white]Change difficulty[/]")
+    commands_right.add_row(create_retro_box(" quit ", "black on red"), "[bright_white]Exit game[/]")
+    
+    commands_panel = Columns([commands_left, commands_right], equal=True, expand=True)
+    
+    return Panel(
+        Align.center(commands_panel),
+        title=create_neon_text("COMMANDS"),
+        border_style="bright_yellow",
+        box=ASCII_DOUBLE_HEAD
+    )
+
+# built once here and reused for every redraw
+COMMANDS_PANEL = create_commands_panel()
+
+def create_difficulty_panel() -> Panel:
+    # difficulty menu box
+    table = Table(show_header=False, box=ASCII_DOUBLE_HEAD, border_style="bright_yellow")
+    table.add_row(
+        create_retro_box(" 1 ", "black on green"),
+        "[bright_green]BEGINNER[/]",
+        "[dim]Easy mode for new players[/]"
+    )
+    table.add_row(
+        create_retro_box(" 2 ", "black on yellow"),
+        "[bright_yellow]ADVANCED[/]",
+        "[dim]Intermediate challenge[/]"
+    )
+    table.add_row(
+        create_retro_box(" 3 ", "black on red"),
+        "[bright_red]CHALLENGE[/]",
+        "[dim]Expert mode with restrictions[/]"
+    )
+    
+    return Panel(
+        Align.center(table),
+        border_style="bright_yellow",
+        box=ASCII_DOUBLE_HEAD,
+        title=create_neon_text("SELECT MODE")
+    )
+
+def create_algorithm_panel() -> Panel:
+    # algorithm menu box
+    table = Table(show_header=False, box=ASCII_DOUBLE_HEAD, border_style="bright_yellow")
+    table.add_row(
+        create_retro_box(" 1 ", "black on cyan"),
+        "[bright_cyan]BFS[/]",
+        "[dim]Breadth-First Search[/]"
+    )
+    table.add_row(
+        create_retro_box(" 2 ", "black on magenta"),
+        "[bright_magenta]UCS[/]",
+        "[dim]Uniform Cost Search[/]"
+    )
+    table.add_row(
+        create_retro_box(" 3 ", "black on green"),
+        "[bright_green]A*[/]",
+        "[dim]A* Search Algorithm[/]"
+    )
+    
+    return Panel(
+        Align.center(table),
+        border_style="bright_yellow",
+        box=ASCII_DOUBLE_HEAD,
+        title=create_neon_text("ALGORITHM SELECT")
+    )
+
+def create_rules_panel() -> Panel:
+    # rules box for welcome screen
+    rules_table = Table(show_header=False, box=ASCII_DOUBLE_HEAD, border_style="bright_yellow")
+    rules_table.add_row(
+        create_retro_box(" 1 ", "black on green"),
+        "[bright_white]Transform start word into target word[/]"
+    )
+    rules_table.add_row(
+        create_retro_box(" 2 ", "black on yellow"),
+        "[bright_white]Change only one letter at a time[/]"
+    )
+    rules_table.add_row(
+        create_retro_box(" 3 ", "black on cyan"),
+        "[bright_white]All words must be in dictionary[/]"
+    )
+    rules_table.add_row(
+        create_retro_box(" 4 ", "black on magenta"),
+        "[bright_white]Complete in minimum moves[/]"
+    )
+    
+    return Panel(
+        Align.center(rules_table),
+        title=create_neon_text("GAME RULES"),
+        border_style="bright_yellow",
+        box=ASCII_DOUBLE_HEAD
+    )
+
+# static screens, built once here and just printed when needed
+WELCOME_TITLE = create_title("⚡ WORD LADDER GAME ⚡")
+RULES_PANEL = create_rules_panel()
+DIFFICULTY_TITLE = create_title("⚡ SELECT DIFFICULTY LEVEL ⚡")
+DIFFICULTY_PANEL = create_difficulty_panel()
+ALGORITHM_TITLE = create_title("⚡ SELECT SEARCH ALGORITHM ⚡")
+ALGORITHM_PANEL = create_algorithm_panel()
+
+# menu number -> setting, same order as menu panels
+DIFFICULTY_CHOICES = {"1": "beginner", "2": "advanced", "3": "challenge"}
+ALGORITHM_CHOICES = {"1": "BFS", "2": "UCS", "3": "A*"}
+
+@lru_cache(maxsize=8)
+def format_banned_words(banned_words: frozenset) -> str:
+    # banned list only changes with difficulty, so same text reused every frame
+    return "⚠ " + " ⚠ ".join(sorted(banned_words))
+
+def format_move_history(moves: List[str], history: Dict) -> str:
+    # history is owned by main loop, only new moves get added to it on each redraw,
+    # if cached moves don't match start of this list (new game or undo) building again
+    count = history['count']
+    if count > len(moves) or (count and moves[count - 1] != history['last_word']):
+        history.update(count=0, last_word=None, text='')
+    
+    for word in moves[history['count']:]:
+        word_text = f"[bright_cyan]{word}[/]"
+        if history['text']:
+            history['text'] += " ⟹ " + word_text
+        else:
+            history['text'] = word_text
+    history['count'] = len(moves)
+    history['last_word'] = moves[-1] if moves else None
+    return history['text']
+
+def display_game_state(game: WordLadderGame, history: Dict):
     # game ki current position dikhane ke liye
     stats_table = Table(show_header=False, box=ASCII_DOUBLE_HEAD, border_style="bright_yellow")
     stats_table.add_row(
@@ -63,19 +201,19 @@ def display_game_state(game: WordLadderGame):
     )
     
     if game.difficulty == "challenge" and game.banned_words:
-        banned_words = " ⚠ ".join(sorted(game.banned_words))
-        banned_words = "⚠ " + banned_words
+        banned_words = format_banned_words(game.banned_words)
         stats_table.add_row(
             create_retro_box(" BANNED ", "black on red"),
             f"[bright_red]{banned_words}[/]", "", ""
         )
     
-    console.print(Panel(
+    # collecting all panels and printing them together, one write per frame
+    panels = [Panel(
         Align.center(stats_table),
         title=create_neon_text("GAME STATS"),
         border_style="bright_yellow",
         box=ASCII_DOUBLE_HEAD
-    ))
+    )]
     
     progress_table = Table(show_header=False, box=ASCII_DOUBLE_HEAD, border_style="bright_yellow")
     progress_table.add_row(
@@ -88,10 +226,10 @@ def display_game_state(game: WordLadderGame):
         create_retro_box(" CURRENT ", "black on cyan"),
         f"[bright_cyan]{game.current_word}[/]",
         create_retro_box(" MOVES ", "black on magenta"),
-        f"[bright_magenta]{len(game.moves) - 1}/{game.move_limit}[/]"
+        f"[bright_magenta]{game.get_current_moves()}/{game.move_limit}[/]"
     )
     
-    console.print(Panel(
+    panels.append(Panel(
         Align.center(progress_table),
         title=create_neon_text("PROGRESS"),
         border_style="bright_yellow",
@@ -99,79 +237,30 @@ def display_game_state(game: WordLadderGame):
     ))
     
     if game.moves:
-        moves_text = " ⟹ ".join(
-            f"[bright_cyan]{word}[/]" for word in game.moves
-        )
-        console.print(Panel(
+        moves_text = format_move_history(game.moves, history)
+        panels.append(Panel(
             Align.center(Text.from_markup(moves_text)),
             title=create_neon_text("HISTORY"),
             border_style="bright_yellow",
             box=ASCII_DOUBLE_HEAD
         ))
     
-    commands_left = Table(show_header=False, box=None, padding=(0, 1))
-    commands_right = Table(show_header=False, box=None, padding=(0, 1))
-    
-    commands_left.add_row(create_retro_box(" WORD ", "black on green"), "[bright_white]Enter a word[/]")
-    commands_left.add_row(create_retro_box(" hint ", "black on yellow"), "[bright_white]Get AI hint[/]")
-    commands_left.add_row(create_retro_box(" algo ", "black on cyan"), "[bright_white]Change algorithm[/]")
-    commands_left.add_row(create_retro_box(" new ", "black on magenta"), "[bright_white]New game[/]")
-    
-    commands_right.add_row(create_retro_box(" compare ", "black on blue"), "[bright_white]Compare algorithms[/]")
-    commands_right.add_row(create_retro_box(" solution ", "black on green"), "[bright_white]See solution[/]")
-    commands_right.add_row(create_retro_box(" mode ", "black on yellow"), "[bright_white]Change difficulty[/]")
-    commands_right.add_row(create_retro_box(" quit ", "black on red"), "[bright_white]Exit game[/]")
-    
-    commands_panel = Columns([commands_left, commands_right], equal=True, expand=True)
+    # commands never change, so using the panel built at startup
+    panels.append(COMMANDS_PANEL)
     
-    console.print(Panel(
-        Align.center(commands_panel),
-        title=create_neon_text("COMMANDS"),
-        border_style="bright_yellow",
-        box=ASCII_DOUBLE_HEAD
-    ))
+    console.print(Group(*panels))
 
 def select_difficulty() -> str:
-    # difficulty choose karne ke liye menu
-    console.print(create_title("⚡ SELECT DIFFICULTY LEVEL ⚡"))
-    
-    table = Table(show_header=False, box=ASCII_DOUBLE_HEAD, border_style="bright_yellow")
-    table.add_row(
-        create_retro_box(" 1 ", "black on green"),
-        "[bright_green]BEGINNER[/]",
-        "[dim]Easy mode for new players[/]"
-    )
-    table.add_row(
-        create_retro_box(" 2 ", "black on yellow"),
-        "[bright_yellow]ADVANCED[/]",
-        "[dim]Intermediate challenge[/]"
-    )
-    table.add_row(
-        create_retro_box(" 3 ", "black on red"),
-        "[bright_red]CHALLENGE[/]",
-        "[dim]Expert mode with restrictions[/]"
-    )
-    
-    console.print(Panel(
-        Align.center(table),
-        border_style="bright_yellow",
-        box=ASCII_DOUBLE_HEAD,
-        title=create_neon_text("SELECT MODE")
-    ))
+    # difficulty choose karne ke liye menu (panels built once at import)
+    console.print(DIFFICULTY_TITLE)
+    console.print(DIFFICULTY_PANEL)
     
     while True:
         try:
-            choice = Prompt.ask(
-                "\n" + create_neon_text("Select your level"),
-                choices=["1", "2", "3"],
-                show_choices=False
-            )
-            if choice == "1":
-                return "beginner"
-            elif choice == "2":
-                return "advanced"
-            elif choice == "3":
-                return "challenge"
+            choice = ask("\n" + create_neon_text("Select your level"))
+            if choice in DIFFICULTY_CHOICES:
+                return DIFFICULTY_CHOICES[choice]
+            console.print("[prompt.invalid.choice]Please select one of the available options")
         except KeyboardInterrupt:
             return "beginner"
 
@@ -214,76 +303,22 @@ def display_algorithm_comparison(game: WordLadderGame):
 
 def select_algorithm() -> str:
     # algorithm choose menu
-    console.print(create_title("⚡ SELECT SEARCH ALGORITHM ⚡"))
-    
-    table = Table(show_header=False, box=ASCII_DOUBLE_HEAD, border_style="bright_yellow")
-    table.add_row(
-        create_retro_box(" 1 ", "black on cyan"),
-        "[bright_cyan]BFS[/]",
-        "[dim]Breadth-First Search[/]"
-    )
-    table.add_row(
-        create_retro_box(" 2 ", "black on magenta"),
-        "[bright_magenta]UCS[/]",
-        "[dim]Uniform Cost Search[/]"
-    )
-    table.add_row(
-        create_retro_box(" 3 ", "black on green"),
-        "[bright_green]A*[/]",
-        "[dim]A* Search Algorithm[/]"
-    )
-    
-    console.print(Panel(
-        Align.center(table),
-        border_style="bright_yellow",
-        box=ASCII_DOUBLE_HEAD,
-        title=create_neon_text("ALGORITHM SELECT")
-    ))
+    console.print(ALGORITHM_TITLE)
+    console.print(ALGORITHM_PANEL)
     
     while True:
         try:
-            choice = Prompt.ask(
-                "\n" + create_neon_text("Select algorithm"),
-                choices=["1", "2", "3"],
-                show_choices=False
-            )
-            if choice == "1":
-                return "BFS"
-            elif choice == "2":
-                return "UCS"
-            elif choice == "3":
-                return "A*"
+            choice = ask("\n" + create_neon_text("Select algorithm"))
+            if choice in ALGORITHM_CHOICES:
+                return ALGORITHM_CHOICES[choice]
+            console.print("[prompt.invalid.choice]Please select one of the available options")
         except KeyboardInterrupt:
             return "A*"
 
 def display_welcome_message():
     # welcome screen
-    console.print(create_title("⚡ WORD LADDER GAME ⚡"))
-    
-    rules_table = Table(show_header=False, box=ASCII_DOUBLE_HEAD, border_style="bright_yellow")
-    rules_table.add_row(
-        create_retro_box(" 1 ", "black on green"),
-        "[bright_white]Transform start word into target word[/]"
-    )
-    rules_table.add_row(
-        create_retro_box(" 2 ", "black on yellow"),
-        "[bright_white]Change only one letter at a time[/]"
-    )
-    rules_table.add_row(
-        create_retro_box(" 3 ", "black on cyan"),
-        "[bright_white]All words must be in dictionary[/]"
-    )
-    rules_table.add_row(
-        create_retro_box(" 4 ", "black on magenta"),
-        "[bright_white]Complete in minimum moves[/]"
-    )
-    
-    console.print(Panel(
-        Align.center(rules_table),
-        title=create_neon_text("GAME RULES"),
-        border_style="bright_yellow",
-        box=ASCII_DOUBLE_HEAD
-    ))
+    console.print(WELCOME_TITLE)
+    console.print(RULES_PANEL)
 
 def display_solution(game: WordLadderGame):
     # solution dikhane ke liye
@@ -300,12 +335,12 @@ def display_solution(game: WordLadderGame):
         " ⟹ ".join(f"[bright_cyan]{word}[/]" for word in game.best_path)
     )
     
-    if game.selected_algorithm in game.algorithm_stats:
-        costs = game.algorithm_stats[game.selected_algorithm]['costs']
-        solution_table.add_row(
-            create_retro_box(" STATS ", "black on magenta"),
-            f"[bright_white]Total {costs['f_cost']} | Path {costs['g_cost']} | Heur {costs['h_cost']}[/]"
-        )
+    # stats of best path itself, no need to run the whole comparison just for this row
+    costs = game.search.get_path_stats(game.best_path, game.target_word)
+    solution_table.add_row(
+        create_retro_box(" STATS ", "black on magenta"),
+        f"[bright_white]Total {costs['f_cost']} | Path {costs['g_cost']} | Heur {costs['h_cost']}[/]"
+    )
     
     console.print(Panel(
         Align.center(solution_table),
@@ -314,12 +349,94 @@ def display_solution(game: WordLadderGame):
         box=ASCII_DOUBLE_HEAD
     ))
 
+def create_error_panel(error_message: str) -> Panel:
+    # error box
+    return create_info_panel(
+        f"[bright_red]{error_message}[/]",
+        create_neon_text("ERROR")
+    )
+
 def handle_input_error(error_message: str):
     # error message
+    console.print(create_error_panel(error_message))
+
+# word rules shown on every invalid move never change, so markup parsed only once
+INVALID_MOVE_PANEL = create_error_panel(
+    "Invalid move!\n\n"
+    "Word Rules:\n"
+    f"{create_retro_box(' 1 ', 'black on green')} Must be in dictionary\n"
+    f"{create_retro_box(' 2 ', 'black on yellow')} Only one letter change\n"
+    f"{create_retro_box(' 3 ', 'black on cyan')} Not in banned list\n"
+    f"{create_retro_box(' 4 ', 'black on magenta')} Within move limit"
+)
+
+def handle_quit(game: WordLadderGame) -> bool:
+    # game khatam, stopping loop
     console.print(create_info_panel(
-        f"[bright_red]{error_message}[/]",
-        create_neon_text("ERROR")
+        "[bright_yellow]Game Over! Thanks for playing![/]",
+        create_neon_text("GAME OVER")
     ))
+    return False
+
+def handle_new(game: WordLadderGame) -> bool:
+    # dropping current puzzle so loop starts a new one
+    game.current_word = None
+    clear_screen()
+    return True
+
+def handle_mode(game: WordLadderGame) -> bool:
+    # changing difficulty
+    difficulty = select_difficulty()
+    if not game.set_difficulty(difficulty):
+        handle_input_error("Failed to change difficulty!")
+    clear_screen()
+    return True
+
+def handle_algo(game: WordLadderGame) -> bool:
+    # changing search method
+    algorithm = select_algorithm()
+    game.set_algorithm(algorithm)
+    clear_screen()
+    return True
+
+def handle_hint(game: WordLadderGame) -> bool:
+    # showing hint for current word
+    hint_word, hint_message = game.get_hint()
+    if hint_word:
+        console.print(create_info_panel(hint_message, create_neon_text("AI HINT")))
+    else:
+        handle_input_error(hint_message)
+    return True
+
+def handle_compare(game: WordLadderGame) -> bool:
+    # algorithms side by side
+    display_algorithm_comparison(game)
+    return True
+
+def handle_solution(game: WordLadderGame) -> bool:
+    # showing best path
+    display_solution(game)
+    return True
+
+def handle_empty(game: WordLadderGame) -> bool:
+    # nothing typed
+    handle_input_error("Please enter a command!")
+    return True
+
+# command -> handler, handler returns False when game should stop
+COMMAND_HANDLERS = {
+    'quit': handle_quit,
+    'new': handle_new,
+    'mode': handle_mode,
+    'algo': handle_algo,
+    'hint': handle_hint,
+    'compare': handle_compare,
+    'solution': handle_solution,
+    '': handle_empty
+}
+
+# commands that change game or clear screen, rest just print below current state
+REDRAW_COMMANDS = frozenset({'new', 'mode', 'algo'})
 
 def main():
     try:
@@ -344,7 +461,9 @@ def main():
             ))
             return
         
-        # main game loop
+        # main game loop, game state only drawn again when something changed
+        needs_redraw = True
+        history = {'count': 0, 'last_word': None, 'text': ''}
         while True:
             try:
                 if not game.current_word:
@@ -356,66 +475,37 @@ def main():
                         f"Transform [bright_green]{game.current_word}[/] into [bright_red]{game.target_word}[/]",
                         create_neon_text("NEW PUZZLE")
                     ))
+                    needs_redraw = True
                 
-                display_game_state(game)
+                if needs_redraw:
+                    display_game_state(game, history)
+                    needs_redraw = False
                 
                 try:
-                    command = Prompt.ask("\n" + create_neon_text("Your move")).strip().lower()
+                    command = ask("\n" + create_neon_text("Your move"))
                 except KeyboardInterrupt:
                     command = 'quit'
                 
-                if command == 'quit':
-                    console.print(create_info_panel(
-                        "[bright_yellow]Game Over! Thanks for playing![/]",
-                        create_neon_text("GAME OVER")
-                    ))
-                    break
-                elif command == 'new':
-                    game.current_word = None
-                    clear_screen()
-                    continue
-                elif command == 'mode':
-                    difficulty = select_difficulty()
-                    if not game.set_difficulty(difficulty):
-                        handle_input_error("Failed to change difficulty!")
-                    clear_screen()
-                    continue
-                elif command == 'algo':
-                    algorithm = select_algorithm()
-                    game.set_algorithm(algorithm)
-                    clear_screen()
-                    continue
-                elif command == 'hint':
-                    hint_word, hint_message = game.get_hint()
-                    if hint_word:
-                        console.print(create_info_panel(hint_message, create_neon_text("AI HINT")))
-                    else:
-                        handle_input_error(hint_message)
-                    continue
-                elif command == 'compare':
-                    display_algorithm_comparison(game)
-                    continue
-                elif command == 'solution':
-                    display_solution(game)
-                    continue
-                elif not command:
-                    handle_input_error("Please enter a command!")
+                # known commands go straight to their handler, anything else is a move
+                handler = COMMAND_HANDLERS.get(command)
+                if handler is not None:
+                    if not handler(game):
+                        break
+                    needs_redraw = command in REDRAW_COMMANDS
                     continue
                 
                 if not game.word_graph.is_valid_word(command):
                     handle_input_error("Word not found in dictionary!")
                     continue
                     
-                if game.is_valid_move(command):
-                    if not game.make_move(command):
-                        handle_input_error("Invalid move!")
-                        continue
-                    
+                # make_move checks the move itself, no need to validate it twice
+                if game.make_move(command):
+                    needs_redraw = True
                     clear_screen()
                     if game.is_solved():
                         console.print(create_info_panel(
                             f"[bright_green]★ CONGRATULATIONS! ★[/]\n"
-                            f"Puzzle solved in [bright_yellow]{len(game.moves)-1}[/] moves!\n"
+                            f"Puzzle solved in [bright_yellow]{game.get_current_moves()}[/] moves!\n"
                             f"Score: [bright_cyan]{game.score}[/]",
                             create_neon_text("VICTORY")
                         ))
@@ -428,14 +518,7 @@ def main():
                         ))
                         game.current_word = None
                 else:
-                    handle_input_error(
-                        "Invalid move!\n\n"
-                        "Word Rules:\n"
-                        f"{create_retro_box(' 1 ', 'black on green')} Must be in dictionary\n"
-                        f"{create_retro_box(' 2 ', 'black on yellow')} Only one letter change\n"
-                        f"{create_retro_box(' 3 ', 'black on cyan')} Not in banned list\n"
-                        f"{create_retro_box(' 4 ', 'black on magenta')} Within move limit"
-                    )
+                    console.print(INVALID_MOVE_PANEL)
                     
             except Exception as e:
                 handle_input_error(f"An error occurred: {str(e)}")
@@ -1,22 +1,18 @@
 from typing import List, Dict, Optional, Tuple
-from word_graph import WordGraph
+from word_graph import WordGraph, LETTER_BITS
+from search_kernels import bfs_kernel, astar_kernel, path_from_parents
+from collections import deque
 import heapq
 
-class SimpleQueue:
-    def __init__(self):
-        # simple queue for bfs
-        self.items_to_process = []
-    
-    def add_item(self, item):
-        self.items_to_process.append(item)
-    
-    def get_next_item(self):
-        if not self.is_empty():
-            return self.items_to_process.pop(0)
-        return None
-    
-    def is_empty(self):
-        return len(self.items_to_process) == 0
+# lowest bit of every letter lane, 64 lanes is more than any dictionary word needs
+LANE_MASK = sum(1 << (LETTER_BITS * lane) for lane in range(64))
+
+def count_letter_differences(first_code: int, second_code: int) -> int:
+    # xor leaves non zero lanes where letters differ, folding each lane into
+    # its lowest bit and counting those bits gives number of different letters
+    diff = first_code ^ second_code
+    diff |= (diff >> 1) | (diff >> 2) | (diff >> 3) | (diff >> 4)
+    return (diff & LANE_MASK).bit_count()
 
 class SmartQueue:
     def __init__(self):
@@ -49,6 +45,11 @@ class SearchAlgorithms:
         if len(current_word) != len(target_word):
             return float('inf')
         
+        # packed words can be compared all at once
+        word_codes = self.word_graph.word_codes
+        if current_word in word_codes and target_word in word_codes:
+            return count_letter_differences(word_codes[current_word], word_codes[target_word])
+        
         return sum(1 for i in range(len(current_word)) 
                   if current_word[i] != target_word[i])
 
@@ -71,27 +72,95 @@ class SearchAlgorithms:
         }
 
     def bfs(self, start_word: str, target_word: str) -> Tuple[Optional[List[str]], Dict[str, int]]:
-        # bfs search - goes level by level
+        # bfs search - goes level by level, runs on word ids using the csr kernel
         if not (self.word_graph.word_exists(start_word) and self.word_graph.word_exists(target_word)):
             return None, {}
 
-        search_queue = SimpleQueue()
-        search_queue.add_item((start_word, [start_word]))
-        visited_words = {start_word}
-        
-        while not search_queue.is_empty():
-            current_word, current_path = search_queue.get_next_item()
-            
-            if current_word == target_word:
-                return current_path, self.get_path_stats(current_path, target_word)
+        # word_exists ignores case but ids are only for dictionary (lowercase) words
+        word_ids = self.word_graph.word_ids
+        start_id, target_id = word_ids.get(start_word), word_ids.get(target_word)
+        if start_id is None or target_id is None:
+            return None, {}
+        parents = bfs_kernel(self.word_graph.adj_indptr, self.word_graph.adj_indices, start_id, target_id)
+        path_ids = path_from_parents(parents, start_id, target_id)
+        if not path_ids:
+            return None, {}
+
+        path = [self.word_graph.id_words[word_id] for word_id in path_ids]
+        return path, self.get_path_stats(path, target_word)
+
+    def bfs_all_distances(self, start_word: str) -> Dict[str, int]:
+        # one bfs from start word giving steps to every word we can reach
+        if not self.word_graph.word_exists(start_word):
+            return {}
 
+        distances = {start_word: 0}
+        words_to_check = deque([start_word])
+
+        while words_to_check:
+            current_word = words_to_check.popleft()
+            next_distance = distances[current_word] + 1
             for next_word in self.word_graph.get_neighbors(current_word):
-                if next_word not in visited_words:
-                    visited_words.add(next_word)
-                    new_path = current_path + [next_word]
-                    search_queue.add_item((next_word, new_path))
+                if next_word not in distances:
+                    distances[next_word] = next_distance
+                    words_to_check.append(next_word)
+
+        return distances
+
+    def path_from_distances(self, start_word: str, distances: Dict[str, int]) -> Optional[List[str]]:
+        # walking downhill on distances to target (from bfs_all_distances(target)),
+        # every step goes to a neighbor one step closer so path is a shortest one
+        if start_word not in distances:
+            return None
+
+        path = [start_word]
+        current_word = start_word
+        while distances[current_word]:
+            next_distance = distances[current_word] - 1
+            current_word = next(word for word in self.word_graph.get_neighbors(current_word)
+                                if distances.get(word) == next_distance)
+            path.append(current_word)
+
+        return path
+
+    def bidir_bfs(self, start_word: str, target_word: str, max_depth: Optional[int] = None) -> Optional[int]:
+        # bfs from both ends at once, only tells how many steps apart words are
+        # (None if no path or longer than max_depth)
+        if not (self.word_graph.word_exists(start_word) and self.word_graph.word_exists(target_word)):
+            return None
+        if start_word == target_word:
+            return 0
+
+        # always growing the smaller side, frontiers meet in the middle
+        this_side, other_side = {start_word: 0}, {target_word: 0}
+        this_frontier, other_frontier = [start_word], [target_word]
+        searched_depth = 0
+
+        while this_frontier and other_frontier:
+            if max_depth is not None and searched_depth >= max_depth:
+                return None
+            if len(this_frontier) > len(other_frontier):
+                this_side, other_side = other_side, this_side
+                this_frontier, other_frontier = other_frontier, this_frontier
+
+            shortest = None
+            next_frontier = []
+            for current_word in this_frontier:
+                for next_word in self.word_graph.get_neighbors(current_word):
+                    if next_word in other_side:
+                        distance = this_side[current_word] + 1 + other_side[next_word]
+                        if shortest is None or distance < shortest:
+                            shortest = distance
+                    elif next_word not in this_side:
+                        this_side[next_word] = this_side[current_word] + 1
+                        next_frontier.append(next_word)
+
+            if shortest is not None:
+                return shortest if max_depth is None or shortest <= max_depth else None
+            this_frontier = next_frontier
+            searched_depth += 1
 
-        return None, {}
+        return None
 
     def ucs(self, start_word: str, target_word: str) -> Tuple[Optional[List[str]], Dict[str, int]]:
         # ucs search - uniform cost search
@@ -122,26 +191,21 @@ class SearchAlgorithms:
         if not (self.word_graph.word_exists(start_word) and self.word_graph.word_exists(target_word)):
             return None, {}
 
-        search_queue = SmartQueue()
-        initial_estimate = self.estimate_remaining_steps(start_word, target_word)
-        search_queue.add_item((start_word, [start_word]), initial_estimate)
-        visited_words = {start_word}
-        path_costs = {start_word: 0}
-        
-        while not search_queue.is_empty():
-            current_word, current_path = search_queue.get_next_item()
-            
-            if current_word == target_word:
-                return current_path, self.get_path_stats(current_path, target_word)
-
-            for next_word in self.word_graph.get_neighbors(current_word):
-                if next_word not in visited_words:
-                    visited_words.add(next_word)
-                    new_path = current_path + [next_word]
-                    steps_taken = self.get_steps_taken(new_path)
-                    estimated_steps = self.estimate_remaining_steps(next_word, target_word)
-                    total_cost = self.calculate_total_cost(steps_taken, estimated_steps)
-                    path_costs[next_word] = steps_taken
-                    search_queue.add_item((next_word, new_path), total_cost)
+        # moves never change word length, so different lengths can't connect
+        if len(start_word) != len(target_word):
+            return None, {}
 
-        return None, {}
\ No newline at end of file
+        # running on word ids with the csr kernel, same as bfs words not in
+        # dictionary case have no id
+        word_ids = self.word_graph.word_ids
+        start_id, target_id = word_ids.get(start_word), word_ids.get(target_word)
+        if start_id is None or target_id is None:
+            return None, {}
+        parents = astar_kernel(self.word_graph.adj_indptr, self.word_graph.adj_indices,
+                               self.word_graph.id_codes, start_id, target_id,
+                               count_letter_differences)
+        path_ids = path_from_parents(parents, start_id, target_id)
+        if not path_ids:
+            return None, {}
+        path = [self.word_graph.id_words[word_id] for word_id in path_ids]
+        return path, self.get_path_stats(path, target_word)
\ No newline at end of file
@@ -0,0 +1,70 @@
+from typing import Callable, Dict, List, Optional
+from array import array
+import heapq
+
+# search loops working on plain int arrays instead of word strings,
+# graph is in csr form: neighbors of word i are indices[indptr[i]:indptr[i+1]]
+
+def bfs_kernel(indptr: array, indices: array, start_id: int, target_id: int) -> Dict[int, int]:
+    # bfs over word ids, gives back parent of every word we reached
+    # (dict and not a full size list, most searches only touch a small part of graph)
+    parents = {start_id: start_id}
+    queue = [start_id]
+    head = 0
+
+    while head < len(queue):
+        node = queue[head]
+        head += 1
+        if node == target_id:
+            break
+        for edge in range(indptr[node], indptr[node + 1]):
+            next_node = indices[edge]
+            if next_node not in parents:
+                parents[next_node] = node
+                queue.append(next_node)
+
+    return parents
+
+def astar_kernel(indptr: array, indices: array, codes: List[Optional[int]], start_id: int, target_id: int,
+                 count_differences: Callable[[int, int], int]) -> Dict[int, int]:
+    # a* over word ids, heap holds (f cost, push order, word id, steps) so no path lists get copied,
+    # heuristic is count_differences on packed codes, gives back parents like bfs_kernel,
+    # words that couldn't be packed (code None) get estimate 0 which never overestimates
+    target_code = codes[target_id]
+    start_code = codes[start_id]
+    if start_code is None or target_code is None:
+        start_estimate = 0
+    else:
+        start_estimate = count_differences(start_code, target_code)
+    parents = {start_id: start_id}
+    frontier = [(start_estimate, 0, start_id, 0)]
+    pushed = 1
+
+    while frontier:
+        _, _, node, steps = heapq.heappop(frontier)
+        if node == target_id:
+            break
+        next_steps = steps + 1
+        for edge in range(indptr[node], indptr[node + 1]):
+            next_node = indices[edge]
+            if next_node not in parents:
+                parents[next_node] = node
+                next_code = codes[next_node]
+                if next_code is None or target_code is None:
+                    estimate = 0
+                else:
+                    estimate = count_differences(next_code, target_code)
+                heapq.heappush(frontier, (next_steps + estimate, pushed, next_node, next_steps))
+                pushed += 1
+
+    return parents
+
+def path_from_parents(parents: Dict[int, int], start_id: int, target_id: int) -> List[int]:
+    # walking parents back from target to start, empty if target never reached
+    if target_id not in parents:
+        return []
+    path = [target_id]
+    while path[-1] != start_id:
+        path.append(parents[path[-1]])
+    path.reverse()
+    return path
@@ -1,5 +1,21 @@
-from typing import Set, Dict, Optional
+from typing import Set, Dict, Optional, List, FrozenSet
 from collections import defaultdict
+from array import array
+import sys
+
+# every letter gets 5 bits, 0 is kept empty so short words don't clash with padding
+LETTER_BITS = 5
+LETTER_CODES = {letter: code for code, letter in enumerate('abcdefghijklmnopqrstuvwxyz-', start=1)}
+
+def pack_word(word: str) -> Optional[int]:
+    # turning word into one int, first letter in lowest bits
+    packed = 0
+    for position, letter in enumerate(word):
+        code = LETTER_CODES.get(letter)
+        if code is None:
+            return None
+        packed |= code << (LETTER_BITS * position)
+    return packed
 
 class WordGraph:
     def __init__(self):
@@ -9,15 +25,34 @@ class WordGraph:
         self.word_connections = defaultdict(set)
         # remembering where each word came from
         self.word_parents = {}
+        # every word packed into an int, for quick letter comparisons
+        self.word_codes: Dict[str, int] = {}
+        # ready made neighbor sets for every connected word, built with the network
+        self.neighbor_sets: Dict[str, FrozenSet[str]] = {}
+        # same connections as int arrays (csr form) for the fast search kernels
+        self.word_ids: Dict[str, int] = {}
+        self.id_words: List[str] = []
+        # packed code per word id (None for words that couldn't be packed)
+        self.id_codes: List[Optional[int]] = []
+        self.adj_indptr = array('i')
+        self.adj_indices = array('i')
         
     def load_words(self, filename: str) -> None:
         try:
             # reading words from file and making them lowercase, simple stuff
+            # (interned so lookups with interned player words match by identity)
             with open(filename, 'r') as file:
-                self.word_list = {word.strip().lower() for word in file if word.strip()}
+                self.word_list = {sys.intern(word.strip().lower()) for word in file if word.strip()}
         except FileNotFoundError:
             print(f"error: could not find file {filename}")
             self.word_list = set()
+        
+        # packing words once here, words with odd characters just get skipped
+        self.word_codes = {}
+        for word in self.word_list:
+            packed = pack_word(word)
+            if packed is not None:
+                self.word_codes[word] = packed
     
     def find_similar_words(self, word: str) -> Set[str]:
         similar_words = set()
@@ -53,6 +88,26 @@ class WordGraph:
                     if similar_word not in self.word_parents:
                         self.word_connections[word].add(similar_word)
                         self.word_parents[similar_word] = word
+        
+        # saving neighbors of each word once, so lookups don't build new sets every time
+        self.neighbor_sets = {}
+        for word in self.word_list:
+            connected_words = self.get_connected_words(word)
+            if connected_words:
+                self.neighbor_sets[word] = frozenset(connected_words)
+        
+        self.build_compact_network()
+    
+    def build_compact_network(self) -> None:
+        # giving every word a number and flattening connections into two int arrays
+        self.id_words = sorted(self.word_list)
+        self.word_ids = {word: word_id for word_id, word in enumerate(self.id_words)}
+        self.id_codes = [self.word_codes.get(word) for word in self.id_words]
+        self.adj_indptr = array('i', [0])
+        self.adj_indices = array('i')
+        for word in self.id_words:
+            self.adj_indices.extend(self.word_ids[w] for w in self.get_neighbors(word))
+            self.adj_indptr.append(len(self.adj_indices))
     
     def get_connected_words(self, word: str) -> Set[str]:
         connected_words = set()
@@ -67,9 +122,9 @@ class WordGraph:
         
         return connected_words
     
-    def get_neighbors(self, word: str) -> Set[str]:
-        # getting all connected words for search algorithms
-        return self.get_connected_words(word)
+    def get_neighbors(self, word: str) -> FrozenSet[str]:
+        # getting all connected words for search algorithms, straight from saved sets
+        return self.neighbor_sets.get(word, frozenset())
     
     def get_path_to_start(self, word: str) -> list[str]:
         path = [word]
@@ -82,22 +137,6 @@ class WordGraph:
         
         return path
     
-    def find_possible_words(self, start: str, target: str) -> Set[str]:
-        visited_words = set()
-        words_to_check = [start]
-        
-        # checking each word and its friends
-        while words_to_check:
-            current_word = words_to_check.pop(0)
-            if current_word not in visited_words:
-                visited_words.add(current_word)
-                # adding connected words to check later
-                for connected_word in self.get_connected_words(current_word):
-                    if connected_word not in visited_words:
-                        words_to_check.append(connected_word)
-        
-        return visited_words
-    
     def is_valid_word(self, word: str) -> bool:
         # checking if word exists in dictionary
         return word.lower() in self.word_list